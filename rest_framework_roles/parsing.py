@@ -1,8 +1,7 @@
+import sys
 import importlib
 
 from django.conf import settings
-from django.utils.module_loading import import_string
-import django.core.exceptions as django_exceptions
 
 from rest_framework_roles.exceptions import Misconfigured
 from rest_framework_roles import decorators
@@ -11,8 +10,14 @@ from rest_framework_roles import decorators
 VALID_SETTINGS = {"ROLES", "SKIP_MODULES"}
 REQUIRED_SETTINGS = {"ROLES"}
 
+# Last parsed roles as (roles_dict, roles_items, parsed_roles). A single entry is enough
+# since in practice the same ROLES setting is parsed over and over.
+_last_parsed_roles = None
+
 
 def validate_config(config):
+    import django.core.exceptions as django_exceptions
+
     for setting in config.keys():
         if setting not in VALID_SETTINGS:
             raise django_exceptions.ImproperlyConfigured(f"Unknown setting '{setting}'")
@@ -33,6 +38,8 @@ def load_roles(config=None):
     """
     Load roles from config
     """
+    from django.utils.module_loading import import_string
+
     settings = load_settings(config)
     roles = settings['ROLES']
     if isinstance(roles, str):
@@ -55,29 +62,44 @@ def parse_roles(roles_dict):
             'role_checker_cost': 50,
         }
     }
+
+    The output for the last given roles_dict is cached, so it should not be modified.
     """
+    global _last_parsed_roles
+
+    roles_items = tuple(roles_dict.items())
+    cached = _last_parsed_roles
+    if cached and cached[0] is roles_dict and cached[1] == roles_items:
+        return cached[2]
+
     d = {}
     for role_name, role_checker in roles_dict.items():
         d[role_name] = {}
         d[role_name]['role_name'] = role_name
         d[role_name]['role_checker'] = role_checker
-        try:
-            cost = role_checker.cost
-        except AttributeError:
-            cost = decorators.DEFAULT_COST
-            role_checker.cost = cost
-        d[role_name]['role_checker_cost'] = cost
+        d[role_name]['role_checker_cost'] = getattr(role_checker, 'cost', decorators.DEFAULT_COST)
+    _last_parsed_roles = (roles_dict, roles_items, d)
     return d
 
 
 def get_permission_list(parsed_roles, raw_permissions):
+    """
+    Build list of (granted, role_checker) sorted by cost of role_checker
+    """
     _permissions = []
-    for role, granted in raw_permissions.items():
+    for index, (role, granted) in enumerate(raw_permissions.items()):
+        if role not in parsed_roles:
+            raise Misconfigured(f"Role '{role}' found in view_permissions but such role not defined in ROLES")
+        parsed_role = parsed_roles[role]
+        # Index breaks ties so that sorting never has to compare granted or role_checker
         _permissions.append((
+            parsed_role['role_checker_cost'],
+            index,
             granted,
-            parsed_roles[role]['role_checker'],
+            parsed_role['role_checker'],
         ))
-    return _permissions
+    _permissions.sort()
+    return [(granted, role_checker) for _, _, granted, role_checker in _permissions]
 
 
 def parse_view_permissions(view_permissions, roles=None):
@@ -88,30 +110,14 @@ def parse_view_permissions(view_permissions, roles=None):
     if not roles:
         roles = load_roles()
     roles = parse_roles(roles)
-    assert type(view_permissions) is dict, f"Expected view_permissions to be dict. Got {view_permissions}"
-    assert type(roles) is dict, f"Expected roles to be dict. Got {roles}"
-
-    # Check roles in permissions are correct before continuing
-    roles_in_view_permissions = set()
-    for permissions in view_permissions.values():
-        for role in permissions.keys():
-            roles_in_view_permissions.add(role)
-    for role in roles_in_view_permissions:
-        if role not in roles:
-            raise Misconfigured(f"Role '{role}' found in view_permissions but such role not defined in ROLES")
+    if not isinstance(view_permissions, dict):
+        raise TypeError(f"Expected view_permissions to be dict. Got {view_permissions}")
 
-    # Populate general and instance checkers
+    # Validate roles, sort by cost and turn into tuples for easy hashing, all in one go
     for view_names, permissions in view_permissions.items():
-        _permissions = get_permission_list(roles, permissions)
+        rules = tuple(get_permission_list(roles, permissions))
         for view_name in view_names.split(","):
-            lookup[view_name] = _permissions
-
-    # Sort by cost
-    for view, rules in lookup.items():
-        rules.sort(key=lambda item: item[1].cost)
-
-    # Finally turn into tuples for easy hashing
-    for view, rules in lookup.items():
-        lookup[view] = tuple(rules)
+            # Interned so lookups by handler name (already interned identifiers) compare by identity
+            lookup[sys.intern(view_name)] = rules
 
-    return lookup
\ No newline at end of file
+    return lookup
@@ -2,9 +2,9 @@ import sys
 import importlib
 import logging
 import fnmatch
-from functools import wraps
+from functools import wraps, lru_cache
+from types import FunctionType
 
-from django.urls import resolve, get_resolver
 from django.urls.resolvers import URLPattern
 from django.conf import settings
 from django.utils.functional import empty
@@ -16,17 +16,6 @@ from rest_framework_roles.exceptions import Misconfigured
 
 logger = logging.getLogger(__name__)
 
-HTTP_VERBS = {
-    'get',
-    'post',
-    'put',
-    'patch',
-    'delete',
-    'head',
-    'options',
-    'trace',
-}
-
 
 DEFAULT_SKIP_MODULES = {
     "django.*"
@@ -35,6 +24,8 @@ DEFAULT_SKIP_MODULES = {
 
 DENY_ALL_PERMISSION = [(True, False)]  # Evaluates role always to True and granted to False
 
+PATCHED_ATTR = "_rfr_patched"  # Marks functions wrapped by us
+
 
 def is_django_configured():
     return settings._wrapped is not empty
@@ -80,39 +71,38 @@ def _rfr_wrap_handler(handler, handler_permissions):
             raise PermissionDenied('Permission denied for user.')
 
         return handler(self, request, *args, **kwargs)
-    
+
+    setattr(_rfr_wrapped_handler, PATCHED_ATTR, True)
     return _rfr_wrapped_handler
 
 
+def is_explicitly_protected(self, handler):
+    """
+    Determine if request handler is mentioned in view_permissions
+    """
+
+    if handler.__name__ in self._view_permissions:
+        return True
+
+    if getattr(self, "action", None):
+        # e.g. ModelViewSet, ViewSet
+        if self.action in self._view_permissions:
+            return True
+
+    # If we can't determine the final handler at this point.
+    # So for safety we return assuming there isn't one
+    return False
+
+
 def _rfr_wrap_check_permissions(original_check_permissions):
+
+    @wraps(original_check_permissions)
     def _rfr_wrapped_check_permissions(self, request):
         """
         Bypass normal check_permissions behaviour when we use check_role_permissions
         """
         handler = retrieve_handler(self, request)
 
-        def is_explicitly_protected(self, request):
-            """
-            Determine if request handler is mentioned in view_permissions
-            """
-
-            if handler.__name__ in self._view_permissions:
-                return True
-
-            if handler.__qualname__.endswith("._rfr_wrapped_handler"): # TRUE
-                # If we have wrapped the handler, it means that it was due
-                # to being explicitly mentioned in view_permissions
-                return True
-
-            if getattr(self, "action", None):
-                # e.g. ModelViewSet, ViewSet
-                if self.action in self._view_permissions:
-                    return True
-
-            # If we can't determine the final handler at this point.
-            # So for safety we return assuming there isn't one
-            return False
-
         # Deny access when no corresponding handler found in view_permissions
         #
         # This is since in that case, _rfr_wrap_handler will never fire and hence
@@ -121,10 +111,11 @@ def _rfr_wrap_check_permissions(original_check_permissions):
         if handler.__name__ == "http_method_not_allowed":
             # Allow 405 to be returned
             return
-        elif not is_explicitly_protected(self, request):
+        elif not is_explicitly_protected(self, handler):
             logger.warning(f"{self.__class__.__name__}: Handler '{handler.__name__}' fired but no explicit permission found in 'view_permissions' for this handler. Denying access")
             raise PermissionDenied('Permission denied for user.')
 
+    setattr(_rfr_wrapped_check_permissions, PATCHED_ATTR, True)
     return _rfr_wrapped_check_permissions
 
 
@@ -137,12 +128,28 @@ def is_callback_method(callback):
     """
     if hasattr(callback, 'view_class'):
         return True
-    try:
-        # Heurestic; all class methods end up calling the dispatch method
-        return callback.__wrapped__.__wrapped__.__name__ == 'dispatch'
-    except AttributeError:
-        pass
-    return False
+    # Heurestic; all class methods end up calling the dispatch method
+    wrapped = getattr(callback, '__wrapped__', None)
+    if wrapped is None:
+        return False
+    wrapped = getattr(wrapped, '__wrapped__', None)
+    return getattr(wrapped, '__name__', None) == 'dispatch'
+
+
+@lru_cache(maxsize=None)
+def _import_view_class(module_name, name):
+    """
+    Resolve view class by module and name. Cached since many patterns share the same module
+    """
+    mod = importlib.import_module(module_name)
+    return getattr(mod, name)
+
+
+def is_patched(cls, name):
+    """
+    Check if attribute of class has been patched directly on the class
+    """
+    return getattr(vars(cls).get(name), PATCHED_ATTR, False)
 
 
 def get_view_class(callback):
@@ -154,9 +161,7 @@ def get_view_class(callback):
     if hasattr(callback, 'cls'):
         return callback.cls
     # TODO: Below code seems to not do anything..
-    mod = importlib.import_module(callback.__module__)
-    cls = getattr(mod, callback.__name__)
-    return cls
+    return _import_view_class(callback.__module__, callback.__name__)
 
 
 def patch(urlconf=None, roleconfig=None):
@@ -192,11 +197,9 @@ def patch(urlconf=None, roleconfig=None):
 
     patterns = get_urlpatterns(urlconf)
 
-    if not patterns:
-        return
-
-    # Collect classes since multiple patterns might use the same view class
-    collected_classes = set()
+    # Multiple patterns might use the same view class so make sure we patch each class once
+    seen_classes = set()
+    patch_classes = []
     for pattern in patterns:
         
         # Skip patching 3rd party entities (e.g. django.contrib.admin)
@@ -210,17 +213,13 @@ def patch(urlconf=None, roleconfig=None):
             continue
 
         cls = get_view_class(pattern.callback)
+        if cls in seen_classes:
+            continue
+        seen_classes.add(cls)
         logger.debug(f'Collecting classes: {pattern} -> {cls}')
-        collected_classes.add(cls)
-
-    # Get classes that need patching
-    patch_classes = []
-    for cls in collected_classes:
-        if hasattr(cls, "view_permissions"):
-            patch_classes.append(cls)
 
-    # Patch classes
-    for cls in patch_classes:
+        if not hasattr(cls, "view_permissions"):
+            continue
 
         # Raise exception if by mistake class has both view_permissions and permission_classes since
         # they can't work together. Note this will not catch the rare occassion that permission_classes = [DenyAll]
@@ -232,39 +231,55 @@ def patch(urlconf=None, roleconfig=None):
         cls._view_permissions = parse_view_permissions(cls.view_permissions, roleconfig)
         
         # Wrap mentioned request handler in view_permissions.
+        #
+        # Handlers already patched on this very class (e.g. patch() called twice) are
+        # skipped so wrappers don't stack up. Handlers patched on a parent class are
+        # still wrapped since the subclass might have different view_permissions.
         for handler_name, handler_permissions in cls._view_permissions.items():
-            if hasattr(cls, handler_name):
-                handler_permissions = cls._view_permissions[handler_name]
-                old_handler = getattr(cls, handler_name)
-                new_handler = _rfr_wrap_handler(old_handler, handler_permissions)
-                setattr(cls, handler_name, new_handler)
-            else:
+            old_handler = vars(cls).get(handler_name)
+            if getattr(old_handler, PATCHED_ATTR, False):
+                continue
+            if not isinstance(old_handler, FunctionType):
+                # Inherited or a descriptor; resolve it through the MRO
+                old_handler = getattr(cls, handler_name, None)
+            if old_handler is None:
                 raise Misconfigured(f"Unknown method '{handler_name}' found in {cls.__name__}.view_permissions")
+            new_handler = _rfr_wrap_handler(old_handler, handler_permissions)
+            setattr(cls, handler_name, new_handler)
 
         # Wrap DRF's check_permissions
-        if hasattr(cls, "check_permissions"):
+        if hasattr(cls, "check_permissions") and not is_patched(cls, "check_permissions"):
             cls.check_permissions = _rfr_wrap_check_permissions(cls.check_permissions)
 
+        patch_classes.append(cls)
+
     return patch_classes
 
 
 def get_urlpatterns(urlconf=None):
     if not urlconf:
         urlconf = importlib.import_module(settings.ROOT_URLCONF)
-    assert type(urlconf) != str, f"URLConf should not be string. Got '{urlconf}'"
-    url_patterns = list(iter_urlpatterns(urlconf.urlpatterns))
-    return url_patterns
+    if isinstance(urlconf, str):
+        raise TypeError(f"URLConf should not be string. Got '{urlconf}'")
+    return iter_urlpatterns(urlconf.urlpatterns)
 
 
 def iter_urlpatterns(urlpatterns):
-    for entity in urlpatterns:
-        if hasattr(entity, 'url_patterns'):
-            yield from iter_urlpatterns(entity.url_patterns)
-        elif hasattr(entity, 'urlpatterns'):
-            yield from iter_urlpatterns(entity.urlpatterns)
-        else:
+    # Depth-first traversal using an explicit stack of iterators instead of recursion,
+    # so that deeply nested includes don't stack up generator frames
+    stack = [iter(urlpatterns)]
+    while stack:
+        for entity in stack[-1]:
+            nested = getattr(entity, 'url_patterns', None)
+            if nested is None:
+                nested = getattr(entity, 'urlpatterns', None)
+            if nested is not None:
+                stack.append(iter(nested))
+                break
             assert type(entity) == URLPattern, f"Expected pattern, got '{entity}'"
             yield entity
+        else:
+            stack.pop()
 
 
 def extract_views_from_urlpatterns(urlpatterns):
@@ -37,6 +37,7 @@ def bool_role(request, view, role_checker):
 
 
 def _check_role_permissions(request, view, view_instance, view_permissions):
+    debug = logger.isEnabledFor(logging.DEBUG)  # Avoid building log messages per rule when not needed
 
     for permissions in view_permissions:
         granted, roles = permissions[0], permissions[1:]
@@ -45,19 +46,21 @@ def _check_role_permissions(request, view, view_instance, view_permissions):
         for role in roles:
             if bool_role(request, view_instance, role):
 
-                role_name = role.__qualname__ if hasattr(role, '__qualname__') else role
-                logger.debug(f"check_role_permissions:{view.__name__}:{role_name}:{granted}")
+                if debug:
+                    role_name = role.__qualname__ if hasattr(role, '__qualname__') else role
+                    logger.debug(f"check_role_permissions:{view.__name__}:{role_name}:{granted}")
 
                 # Check permission is granted:
                 #   - We only return once we have evaluated positevely a granting rule.
                 #     This is since if this rule doesn't grant permission, the next could.
                 #   - We don't return False here, since *pre_view* will perform any other checks.
                 #
-                if type(granted) is bool:
+                granted_type = type(granted)
+                if granted_type is bool:
                     pass
-                elif type(granted) is TYPE_FUNCTION:
+                elif granted_type is TYPE_FUNCTION:
                     granted = bool_granted(request, view, granted, view_instance)
-                elif type(granted) is GrantChecker:
+                elif granted_type is GrantChecker:
                     granted = granted.evaluate(request, view, view_instance)
                 else:
                     raise Misconfigured("From v0.4.0+ you need to use 'anyof', 'allof' or similar for multiple grant checks")
@@ -99,7 +102,8 @@ def check_role_permissions(request, view, view_instance, view_permissions):
     if permissions_granted and view_permissions in permissions_granted:
         return True
 
-    logger.debug(f'Check permissions for {request}..')
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f'Check permissions for {request}..')
 
     # Determine permissions
     return _check_role_permissions(request, view, view_instance, view_permissions)
\ No newline at end of file
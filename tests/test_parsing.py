@@ -2,8 +2,9 @@ import pytest
 
 from rest_framework_roles.roles import is_admin, is_user, is_anon
 from rest_framework_roles.parsing import parse_roles, parse_view_permissions, get_permission_list
-from rest_framework_roles.decorators import role_checker
+from rest_framework_roles.decorators import role_checker, DEFAULT_COST
 from rest_framework_roles.granting import allof, anyof
+from rest_framework_roles.exceptions import Misconfigured
 
 
 def test_parse_roles():
@@ -17,10 +18,13 @@ def test_parse_roles():
     }
 
 
-def test_parse_roles_adds_cost_attr():
-    roles = parse_roles({'admin': is_admin})
-    assert hasattr(roles['admin']['role_checker'], 'cost')
-    assert roles['admin']['role_checker'].cost == roles['admin']['role_checker_cost']
+def test_parse_roles_does_not_modify_role_checker():
+    def is_plain(request, view):
+        pass
+
+    roles = parse_roles({'plain': is_plain})
+    assert roles['plain']['role_checker_cost'] == DEFAULT_COST
+    assert not hasattr(is_plain, 'cost')
 
 
 def test_parse_roles_cost():
@@ -38,6 +42,20 @@ def test_parse_roles_cost():
     }
 
 
+def test_parse_roles_cached():
+    roles = {'admin': is_admin}
+    assert parse_roles(roles) is parse_roles(roles)
+    assert parse_roles(roles) is not parse_roles({'admin': is_admin})
+
+
+def test_parse_roles_cache_invalidated_on_change():
+    roles = {'admin': is_admin}
+    parsed = parse_roles(roles)
+    roles['user'] = is_user
+    assert parse_roles(roles) is not parsed
+    assert 'user' in parse_roles(roles)
+
+
 def test_parse_view_permissions():
     is_not_updating_permissions = lambda v, r: True
     is_self = lambda v, r: True
@@ -129,6 +147,16 @@ def test_rules_sorted_by_cost():
     }
 
 
+def test_parse_view_permissions_not_dict():
+    with pytest.raises(TypeError):
+        parse_view_permissions([('create', {'admin': True})], {'admin': is_admin})
+
+
+def test_parse_view_permissions_unknown_role():
+    with pytest.raises(Misconfigured):
+        parse_view_permissions({'create': {'admin': True, 'superhero': True}}, {'admin': is_admin})
+
+
 @pytest.mark.parametrize("samehash,p1,p2", (
     (True, ((True, is_user), (True, is_admin)), ((True, is_user), (True, is_admin))),
     (False, ((True, is_user), (True, is_admin)), ((True, is_user), (True, is_anon))),
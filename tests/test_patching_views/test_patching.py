@@ -60,4 +60,24 @@ def test_not_interfere_with_third_party():
 
     # Ensure not patched
     for pattern in patterns:
-        assert '_rfr_wrapped' not in pattern.callback.__qualname__
\ No newline at end of file
+        assert '_rfr_wrapped' not in pattern.callback.__qualname__
+
+
+def test_get_urlpatterns_rejects_string_urlconf():
+    with pytest.raises(TypeError):
+        patching.get_urlpatterns(__name__)
+
+
+def test_iter_urlpatterns_nested_includes():
+    nested_urlpatterns = [
+        path('a', django_function_view_undecorated),
+        path('inner/', include([
+            path('b', django_function_view_undecorated),
+            path('innermost/', include([
+                path('c', django_function_view_undecorated),
+            ])),
+        ])),
+        path('d', django_function_view_undecorated),
+    ]
+    patterns = list(patching.iter_urlpatterns(nested_urlpatterns))
+    assert [str(pattern.pattern) for pattern in patterns] == ['a', 'b', 'c', 'd']
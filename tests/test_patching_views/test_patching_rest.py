@@ -162,4 +162,21 @@ def test_calling_unmixed_verb(db, rest_resolver, client):
 @pytest.mark.urls(__name__)
 def test_patched_handler_docstring_preserved(db, rest_resolver, client):
     view = RestAPIView()
-    assert "some docstring" in view.view_patched_by_view_permissions.__doc__
\ No newline at end of file
+    assert "some docstring" in view.view_patched_by_view_permissions.__doc__
+
+
+@pytest.mark.urls(__name__)
+def test_patched_check_permissions_preserves_metadata(db, rest_resolver, client):
+    check_permissions = RestAPIView.check_permissions
+    assert check_permissions.__name__ == 'check_permissions'
+    assert check_permissions.__wrapped__ is drf.views.APIView.check_permissions
+    assert getattr(check_permissions, patching.PATCHED_ATTR)
+
+
+@pytest.mark.urls(__name__)
+def test_patching_twice_does_not_rewrap(db, rest_resolver, client):
+    handler = RestAPIView.view_patched_by_view_permissions
+    check_permissions = RestAPIView.check_permissions
+    patching.patch(importlib.import_module(__name__))
+    assert RestAPIView.view_patched_by_view_permissions is handler
+    assert RestAPIView.check_permissions is check_permissions
@@ -1,4 +1,5 @@
 import importlib
+import logging
 from unittest.mock import patch
 
 import pytest
@@ -144,13 +145,32 @@ class WithCustomPermissionClassesAllowAny(drf.viewsets.ModelViewSet):
     permission_classes = [drf.permissions.AllowAny]
 
 
+class InheritedHandlerParent(drf.views.APIView):
+    view_permissions = {'get': {'anon': True}}
+
+    def get(self, request):
+        return HttpResponse()
+
+
+class InheritedHandlerChild(InheritedHandlerParent):
+    """Inherits the parent's patched 'get' but doesn't mention it in its own view_permissions"""
+    view_permissions = {'post': {'anon': True}}
+
+    def post(self, request):
+        return HttpResponse()
+
+
 router = drf.routers.DefaultRouter()
 router.register(r'users', UserViewSet, basename='user')
 router.register(r'no_custom_permission_classes_no_view_permissions', NoViewPermissionsNoPermissionClasses, basename='no_custom_permission_classes_no_view_permissions')
 router.register(r'with_custom_permission_classes_allowany', WithCustomPermissionClassesAllowAny, basename='with_custom_permission_classes_allowany')
 router.register(r'only_admin_list', RestrictedListViewSet, basename='only_admin_list')
 router.register(r'anyone_list', PermissiveListViewSet, basename='anyone_list')
-urlpatterns = [path('', include(router.urls)),]
+urlpatterns = [
+    path('', include(router.urls)),
+    path('inherited_handler_parent', InheritedHandlerParent.as_view()),
+    path('inherited_handler_child', InheritedHandlerChild.as_view()),
+]
 
 
 # ------------------------------------------------------------------------------
@@ -167,6 +187,14 @@ class TestUserAPI():
         assert_disallowed(anon, get='/users/')
         assert_disallowed(user, get='/users/')
 
+    def test_permissions_checked_without_debug_logging(self, caplog, user, anon, admin):
+        caplog.set_level(logging.INFO, logger='rest_framework_roles.permissions')
+        assert_allowed(admin, get='/users/')
+        assert_disallowed(anon, get='/users/')
+        assert_disallowed(user, get='/users/')
+        assert_allowed(user, get=f'/users/{user.id}/')
+        assert_disallowed(user, get=f'/users/{admin.id}/')
+
     def test_user_can_retrieve_only_self(self, user, anon, admin):
         other_user = User.objects.create(username='otheruser')
         other_user_url = f'/users/{other_user.id}/'
@@ -351,4 +379,15 @@ class TestGroupedPermissions:
         assert mocked_check_role_permissions.call_count == 2
 
         # BUT the 3nd time we expect the checking to have been bypassed
-        assert _mocked_check_role_permissions.call_count == 1
\ No newline at end of file
+        assert _mocked_check_role_permissions.call_count == 1
+
+
+@pytest.mark.urls(__name__)
+class TestInheritedHandlers:
+    def setup(self):
+        patching.patch()
+
+    def test_inherited_patched_handler_not_in_view_permissions_denied(self, anon):
+        assert_allowed(anon, get='/inherited_handler_parent')
+        assert_disallowed(anon, get='/inherited_handler_child')
+        assert_allowed(anon, post='/inherited_handler_child')